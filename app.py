@@ -9,19 +9,35 @@ Streamlit-App für den kompletten Protokoll-Workflow:
 5. Download oder E-Mail-Versand
 
 Starten mit: streamlit run app.py
+
+Optionale Einstellungen (.env oder Streamlit Secrets, Standard aus):
+- TRANSCRIPT_CLEANUP=1: Füllwörter und Whisper-Schleifen vor GPT-4o entfernen
+- WHISPER_CACHE=1: Transkripte nach Audio-Hash cachen
+- PROTOCOL_CACHE=1: Protokolle für identische Prompts cachen
+  Achtung: Beide Caches speichern vollständige Transkripte bzw. Protokolle im
+  Klartext unter .cache/ (max. 50 Einträge pro Typ, 7 Tage). Ohne die Caches
+  werden Audio- und Zwischendateien nach jeder Verarbeitung gelöscht.
 """
 
 import os
 import io
+import logging
 import re
+import json
+import hashlib
+import base64
 import tempfile
 import smtplib
 import math
+import glob
+import queue
+import threading
+import atexit
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.application import MIMEApplication
+from email.message import EmailMessage
 
 import streamlit as st
 from openai import OpenAI
@@ -38,6 +54,8 @@ import shutil
 import platform
 import urllib.request
 
+logger = logging.getLogger(__name__)
+
 # Typische ffmpeg-Pfade auf macOS
 FFMPEG_PATHS = [
     "/opt/homebrew/bin/ffmpeg",  # Apple Silicon Homebrew
@@ -89,15 +107,33 @@ def get_ffmpeg_path():
 FFMPEG_PATH = find_ffmpeg()
 FFMPEG_AVAILABLE = FFMPEG_PATH is not None
 
-# .env laden (für lokale Entwicklung)
 PROJECT_ROOT = Path(__file__).resolve().parent
-load_dotenv(PROJECT_ROOT / ".env")
+
+
+@st.cache_resource
+def load_env() -> bool:
+    """Lädt die .env-Datei einmal pro Prozess (für lokale Entwicklung).
+
+    Streamlit führt app.py bei jeder Interaktion neu aus; die Werte bleiben
+    danach in os.environ. Änderungen an .env greifen erst nach einem Neustart.
+    """
+    return load_dotenv(PROJECT_ROOT / ".env")
+
+
+load_env()
 
 # Logo-Pfad (für App Logo)
 LOGO_PATH = PROJECT_ROOT / "ICON.png"
 LOGO_AVAILABLE = LOGO_PATH.exists()
 
 
+@st.cache_data(show_spinner=False)
+def get_logo_base64() -> str:
+    """Lädt das Logo einmalig als Base64-String für die Einbettung in HTML."""
+    with open(LOGO_PATH, "rb") as f:
+        return base64.b64encode(f.read()).decode()
+
+
 def get_secret(key: str, default: str = "") -> str:
     """Holt Secret aus Streamlit Cloud oder .env."""
     try:
@@ -106,12 +142,44 @@ def get_secret(key: str, default: str = "") -> str:
         return os.getenv(key, default)
 
 
+def get_int_secret(key: str, default: int, minimum: int = 1) -> int:
+    """Holt eine Ganzzahl-Einstellung; ungültige Werte ergeben den Standardwert."""
+    try:
+        return max(minimum, int(get_secret(key, str(default))))
+    except (TypeError, ValueError):
+        logger.warning("Ungültiger Wert für %s, verwende %d", key, default)
+        return default
+
+
 # Konfiguration
 AUDIO_EXTENSIONS = (".mp3", ".wav", ".m4a", ".ogg", ".webm", ".mp4", ".mpeg", ".mpga")
 WHISPER_CHUNK_SIZE = 24 * 1024 * 1024  # 24 MB (Whisper Limit ist 25 MB)
 CHUNK_DURATION_MS = 10 * 60 * 1000  # 10 Minuten pro Chunk
+WHISPER_MAX_CONCURRENCY = get_int_secret("WHISPER_MAX_CONCURRENCY", 4)  # Parallele Whisper-Uploads
+WHISPER_MODEL = "whisper-1"
+WHISPER_LANGUAGE = "de"
+WHISPER_CACHE_ENABLED = get_secret("WHISPER_CACHE", "0") == "1"  # Transkripte nach Audio-Hash cachen
+PROTOCOL_MODEL = "gpt-4o"
+TRANSCRIPT_CLEANUP_ENABLED = get_secret("TRANSCRIPT_CLEANUP", "0") == "1"  # Füllwörter/Whisper-Schleifen vor GPT entfernen
+WHISPER_MAX_RETRIES = 5  # Wiederholungen pro Whisper-Upload bei 429/5xx/Verbindungsfehlern (mit Backoff)
+PROTOCOL_CACHE_ENABLED = get_secret("PROTOCOL_CACHE", "0") == "1"  # Protokolle nach Prompt-Hash cachen
+CACHE_DIR = PROJECT_ROOT / ".cache"  # Enthält Transkripte/Protokolle im Klartext
+CACHE_MAX_AGE = 7 * 24 * 60 * 60  # Sekunden; ältere Einträge werden gelöscht
+CACHE_MAX_ENTRIES = 50  # Pro Cache-Typ, älteste zuerst gelöscht
 MAX_FILE_SIZE = 200 * 1024 * 1024  # Immer 200 MB erlauben
 MAX_FILE_SIZE_MB = 200
+PROGRESS_STEPS = ("Upload", "Transkription", "Protokoll", "Dokumente", "Fertig")
+SECTION_MARKERS = frozenset({"---", "===DECKBLATT===", "===INHALT===", "===ABSCHLUSS==="})
+
+# Startwerte des Session State (auch für "Neues Protokoll erstellen")
+SESSION_DEFAULTS = {
+    "transcript": None,
+    "protocol": None,
+    "pdf_bytes": None,
+    "docx_bytes": None,
+    "processing": False,
+    "error": None,
+}
 
 # ============================================================================
 # PWA (Progressive Web App) Konfiguration
@@ -156,6 +224,8 @@ PWA_SERVICE_WORKER = """
 </script>
 """
 
+PWA_HTML = PWA_META_TAGS + PWA_SERVICE_WORKER
+
 # ============================================================================
 # Custom CSS - Apple-Style minimalistisches Design
 # ============================================================================
@@ -203,7 +273,7 @@ CUSTOM_CSS = """
         padding: 12px 24px !important;
         font-size: 17px !important;
         font-weight: 400 !important;
-        transition: all 0.3s ease !important;
+        transition: background-color 0.3s ease, transform 0.3s ease !important;
         min-height: 50px;
     }
 
@@ -338,6 +408,7 @@ CUSTOM_CSS = """
         font-size: 12px;
         color: #86868b;
         z-index: 999;
+        contain: layout paint style;
     }
 
     /* ============================================
@@ -429,6 +500,14 @@ CUSTOM_CSS = """
 </style>
 """
 
+FOOTER_HTML = (
+    '<div class="custom-footer">'
+    '<a href="https://www.spekt.ch" target="_blank" style="color: #86868b; text-decoration: none;">'
+    'SPEKTRUM Partner GmbH</a></div>'
+)
+
+STATIC_CHROME_HTML = CUSTOM_CSS + FOOTER_HTML
+
 # ============================================================================
 # PDF-Klasse (aus create_pdf.py)
 # ============================================================================
@@ -438,6 +517,7 @@ class ProtocolPDF(FPDF):
 
     BLACK = (0, 0, 0)
     GRAY = (100, 100, 100)
+    BODY_CHAR_MAP = str.maketrans({"\u2022": "-", chr(149): "-"})  # Aufzählungszeichen
 
     def __init__(self):
         super().__init__()
@@ -534,8 +614,7 @@ class ProtocolPDF(FPDF):
         self.set_x(self.l_margin)
         self.set_font("Helvetica", "", 10)
         self.set_text_color(*self.BLACK)
-        text = text.replace("\u2022", "-").replace(chr(149), "-")
-        text = text.replace("**", "")
+        text = text.translate(self.BODY_CHAR_MAP).replace("**", "")
         self.multi_cell(0, 5.5, text)
         self.ln(2)
 
@@ -564,6 +643,74 @@ class ProtocolPDF(FPDF):
 # Kernfunktionen
 # ============================================================================
 
+@st.cache_resource
+def get_openai_client(api_key: str) -> OpenAI:
+    """Erstellt den OpenAI-Client einmalig pro Prozess (wiederverwendet über Reruns)."""
+    return OpenAI(api_key=api_key)
+
+
+def make_cache_key(*parts: str) -> str:
+    """Erstellt einen stabilen Cache-Schlüssel aus den angegebenen Teilen."""
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def file_sha256(file_path: str) -> str:
+    """Berechnet den SHA-256 einer Datei blockweise (1 MiB)."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_cache(namespace: str, key: str) -> str | None:
+    """Liest einen Eintrag aus dem Datei-Cache (None bei Cache-Miss oder abgelaufenem Eintrag)."""
+    path = CACHE_DIR / namespace / f"{key}.txt"
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_MAX_AGE:
+            path.unlink()
+            return None
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning("[CACHE] Lesen fehlgeschlagen: %s", e)
+        return None
+
+
+def prune_cache(cache_dir: Path):
+    """Löscht abgelaufene Einträge und behält höchstens CACHE_MAX_ENTRIES (die neuesten)."""
+    entries = []
+    for path in cache_dir.glob("*.txt"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            continue
+    entries.sort(reverse=True)
+    now = time.time()
+    for index, (mtime, path) in enumerate(entries):
+        if index >= CACHE_MAX_ENTRIES or now - mtime > CACHE_MAX_AGE:
+            path.unlink(missing_ok=True)
+
+
+def write_cache(namespace: str, key: str, text: str):
+    """Schreibt einen Eintrag atomar in den Datei-Cache (temporäre Datei + os.replace)."""
+    cache_dir = CACHE_DIR / namespace
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, cache_dir / f"{key}.txt")
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+        prune_cache(cache_dir)
+    except OSError as e:
+        logger.warning("[CACHE] Schreiben fehlgeschlagen: %s", e)
+
+
 def get_ffprobe_path():
     """Findet ffprobe (liegt im gleichen Ordner wie ffmpeg)."""
     if FFMPEG_PATH:
@@ -576,9 +723,9 @@ def get_ffprobe_path():
 def get_audio_duration(file_path: str) -> float:
     """Ermittelt die Dauer einer Audio-Datei in Sekunden mit ffprobe."""
     ffprobe = get_ffprobe_path()
-    print(f"[DURATION] ffprobe path: {ffprobe}")
+    logger.debug("[DURATION] ffprobe path: %s", ffprobe)
     if not ffprobe:
-        print("[DURATION] FEHLER: ffprobe nicht gefunden!")
+        logger.error("[DURATION] FEHLER: ffprobe nicht gefunden!")
         return 0
     try:
         result = subprocess.run(
@@ -586,72 +733,120 @@ def get_audio_duration(file_path: str) -> float:
              "-of", "default=noprint_wrappers=1:nokey=1", file_path],
             capture_output=True, text=True, timeout=30
         )
-        print(f"[DURATION] ffprobe output: '{result.stdout.strip()}', stderr: '{result.stderr.strip()}'")
+        logger.debug("[DURATION] ffprobe output: '%s', stderr: '%s'", result.stdout.strip(), result.stderr.strip())
         duration = float(result.stdout.strip())
-        print(f"[DURATION] Dauer: {duration} Sekunden")
+        logger.debug("[DURATION] Dauer: %s Sekunden", duration)
         return duration
     except Exception as e:
-        print(f"[DURATION] FEHLER: {e}")
+        logger.error("[DURATION] FEHLER: %s", e)
         return 0
 
 
-def split_audio_file(file_path: str, chunk_duration_ms: int = CHUNK_DURATION_MS) -> list:
-    """Teilt eine Audio-Datei in kleinere Chunks auf mit ffmpeg."""
-    print(f"[SPLIT] Start - ffmpeg available: {FFMPEG_AVAILABLE}, path: {FFMPEG_PATH}")
+def get_chunk_files(file_path: str) -> list:
+    """Findet alle (auch halb geschriebenen) Chunk-Dateien zu einer Audio-Datei."""
+    base_path = os.path.splitext(file_path)[0]
+    return sorted(glob.glob(f"{glob.escape(base_path)}_chunk[0-9][0-9][0-9].mp3"))
 
-    if not FFMPEG_AVAILABLE or not FFMPEG_PATH:
-        print("[SPLIT] FEHLER: ffmpeg nicht verfügbar!")
-        return [file_path]
 
-    try:
-        # Audio-Dauer ermitteln
-        duration_sec = get_audio_duration(file_path)
-        chunk_duration_sec = chunk_duration_ms / 1000
-        print(f"[SPLIT] Audio-Dauer: {duration_sec} Sekunden ({duration_sec/60:.1f} Minuten)")
-        print(f"[SPLIT] Chunk-Dauer: {chunk_duration_sec} Sekunden")
-
-        # Wenn Audio kurz genug ist oder Dauer unbekannt, nicht splitten
-        if duration_sec <= 0:
-            print("[SPLIT] FEHLER: Konnte Audio-Dauer nicht ermitteln!")
-            return [file_path]
-
-        if duration_sec <= chunk_duration_sec:
-            print("[SPLIT] Audio kurz genug, kein Splitting nötig")
-            return [file_path]
-
-        # In Chunks aufteilen mit ffmpeg
-        chunks = []
-        num_chunks = math.ceil(duration_sec / chunk_duration_sec)
-        base_path = os.path.splitext(file_path)[0]
-
-        for i in range(num_chunks):
-            start_sec = i * chunk_duration_sec
-            chunk_path = f"{base_path}_chunk{i}.mp3"
-
-            # ffmpeg Befehl: Segment extrahieren und als MP3 speichern
-            cmd = [
-                FFMPEG_PATH, "-y", "-i", file_path,
-                "-ss", str(start_sec),
-                "-t", str(chunk_duration_sec),
-                "-acodec", "libmp3lame", "-b:a", "128k",
-                "-loglevel", "error",
-                chunk_path
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, timeout=120)
-            if result.returncode == 0 and os.path.exists(chunk_path):
-                chunks.append(chunk_path)
-            else:
-                # Bei Fehler: Aufräumen und Original zurückgeben
-                for c in chunks:
-                    if os.path.exists(c):
-                        os.remove(c)
-                return [file_path]
+def split_audio_file(file_path: str, chunk_duration_ms: int = CHUNK_DURATION_MS, chunk_callback=None) -> list:
+    """Teilt eine Audio-Datei in kleinere Chunks auf mit ffmpeg.
 
-        return chunks
-    except Exception as e:
-        # Bei Fehler: Original-Datei zurückgeben
-        return [file_path]
+    chunk_callback wird für jeden fertig geschriebenen Chunk sofort aufgerufen,
+    damit die Transkription schon während des Splittens beginnen kann.
+    Kurze, aber zu grosse Dateien (z.B. unkomprimiertes WAV) werden als ein einzelner
+    MP3-Chunk neu kodiert. Wirft RuntimeError mit dem konkreten Grund, wenn nicht
+    gesplittet werden kann. Das Löschen der Chunks (get_chunk_files) ist Sache des Aufrufers.
+    """
+    logger.debug("[SPLIT] Start - ffmpeg available: %s, path: %s", FFMPEG_AVAILABLE, FFMPEG_PATH)
+
+    if not FFMPEG_AVAILABLE or not FFMPEG_PATH:
+        logger.error("[SPLIT] FEHLER: ffmpeg nicht verfügbar!")
+        raise RuntimeError("ffmpeg wurde nicht gefunden - grosse Dateien können nicht aufgeteilt werden.")
+
+    # Audio-Dauer ermitteln
+    duration_sec = get_audio_duration(file_path)
+    chunk_duration_sec = chunk_duration_ms / 1000
+    logger.debug("[SPLIT] Audio-Dauer: %s Sekunden (%.1f Minuten)", duration_sec, duration_sec / 60)
+    logger.debug("[SPLIT] Chunk-Dauer: %s Sekunden", chunk_duration_sec)
+
+    if duration_sec <= 0:
+        logger.error("[SPLIT] FEHLER: Konnte Audio-Dauer nicht ermitteln!")
+        raise RuntimeError(
+            "Die Audio-Dauer konnte nicht ermittelt werden (ffprobe fehlt oder die Datei ist "
+            "beschädigt), daher kann die Datei nicht aufgeteilt werden."
+        )
+
+    # In Chunks aufteilen mit ffmpeg (ein Durchlauf mit dem Segment-Muxer)
+    num_chunks = max(1, math.ceil(duration_sec / chunk_duration_sec))
+    base_path = os.path.splitext(file_path)[0]
+    chunk_pattern = f"{base_path}_chunk%03d.mp3"
+
+    # Die Segment-Liste auf stdout meldet jeden Chunk, sobald er abgeschlossen ist
+    cmd = [
+        FFMPEG_PATH, "-y",
+        "-i", file_path,
+        "-vn",
+        "-acodec", "libmp3lame", "-b:a", "128k",
+        "-f", "segment",
+        "-segment_time", str(chunk_duration_sec),
+        "-reset_timestamps", "1",
+        "-segment_list", "pipe:1",
+        "-segment_list_type", "flat",
+        "-loglevel", "error",
+        chunk_pattern
+    ]
+
+    chunks = []
+    chunk_dir = os.path.dirname(base_path)
+    timed_out = threading.Event()
+
+    # stderr in eine Datei statt in eine Pipe: eine volle Pipe würde ffmpeg blockieren
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True, errors="replace") as proc:
+            # Watchdog: beendet ffmpeg nach Ablauf der Frist, auch während stdout gelesen wird
+            def kill_ffmpeg():
+                timed_out.set()
+                proc.kill()
+
+            watchdog = threading.Timer(120 * num_chunks, kill_ffmpeg)
+            watchdog.start()
+            try:
+                for entry in proc.stdout:
+                    entry = entry.strip()
+                    if not entry:
+                        continue
+                    chunk_path = os.path.join(chunk_dir, os.path.basename(entry))
+                    chunks.append(chunk_path)
+                    if chunk_callback:
+                        chunk_callback(chunk_path)
+                proc.wait()
+            finally:
+                watchdog.cancel()
+                if proc.poll() is None:
+                    # Abbruch durch eine Exception im Callback: ffmpeg nicht weiterlaufen lassen
+                    proc.kill()
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode(errors="replace").strip()
+
+    if proc.returncode != 0 or not chunks:
+        logger.error("[SPLIT] ffmpeg fehlgeschlagen: %s", stderr[-2000:])
+        if timed_out.is_set():
+            raise RuntimeError(f"ffmpeg hat das Splitten nach {120 * num_chunks} Sekunden nicht abgeschlossen")
+        raise RuntimeError(f"ffmpeg konnte die Audio-Datei nicht aufteilen: {stderr[-500:]}")
+
+    return chunks
+
+
+def transcribe_chunk(file_path: str, client: OpenAI) -> str:
+    """Transkribiert eine einzelne Audio-Datei (max. 25 MB) mit OpenAI Whisper."""
+    with open(file_path, "rb") as f:
+        return client.with_options(max_retries=WHISPER_MAX_RETRIES).audio.transcriptions.create(
+            model=WHISPER_MODEL,
+            file=f,
+            language=WHISPER_LANGUAGE,
+            response_format="text"
+        )
 
 
 def transcribe_audio(audio_file, client: OpenAI, progress_callback=None, status_callback=None) -> str:
@@ -660,11 +855,9 @@ def transcribe_audio(audio_file, client: OpenAI, progress_callback=None, status_
 
     # Temporäre Datei erstellen
     with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp:
-        tmp.write(audio_file.read())
+        shutil.copyfileobj(audio_file, tmp)
         tmp_path = tmp.name
 
-    chunk_paths = []
-
     try:
         # Dateigröße prüfen
         file_size = os.path.getsize(tmp_path)
@@ -672,61 +865,66 @@ def transcribe_audio(audio_file, client: OpenAI, progress_callback=None, status_
         if status_callback:
             status_callback(f"📁 Dateigrösse: {file_size // (1024*1024)} MB")
 
+        # Identische Audio-Datei schon einmal transkribiert?
+        cache_key = None
+        if WHISPER_CACHE_ENABLED:
+            cache_key = make_cache_key(WHISPER_MODEL, WHISPER_LANGUAGE, file_sha256(tmp_path))
+            cached = read_cache("transcripts", cache_key)
+            if cached is not None:
+                if status_callback:
+                    status_callback("♻️ Transkript aus Cache geladen")
+                return cached
+
         if file_size <= WHISPER_CHUNK_SIZE:
             # Kleine Datei - direkt transkribieren
             if status_callback:
                 status_callback("📝 Kleine Datei - direkte Transkription...")
-            with open(tmp_path, "rb") as f:
-                transcript = client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=f,
-                    language="de",
-                    response_format="text"
-                )
-            return transcript
+            transcript = transcribe_chunk(tmp_path, client)
         else:
             # Große Datei - in Chunks aufteilen
             if status_callback:
                 status_callback(f"✂️ Grosse Datei - wird gesplittet (ffmpeg: {FFMPEG_PATH})...")
 
-            chunk_paths = split_audio_file(tmp_path)
-
-            if status_callback:
-                status_callback(f"📦 {len(chunk_paths)} Audio-Teile erstellt")
-
-            # Prüfen ob wirklich gesplittet wurde
-            if len(chunk_paths) == 1 and chunk_paths[0] == tmp_path:
-                if status_callback:
-                    status_callback("⚠️ WARNUNG: Datei wurde NICHT gesplittet!")
-
-            transcripts = []
-            for i, chunk_path in enumerate(chunk_paths):
-                if progress_callback:
-                    progress_callback(i + 1, len(chunk_paths))
-                if status_callback:
-                    chunk_size = os.path.getsize(chunk_path) // (1024*1024)
-                    status_callback(f"🎙️ Transkribiere Teil {i+1}/{len(chunk_paths)} ({chunk_size} MB)...")
-
-                with open(chunk_path, "rb") as f:
-                    chunk_transcript = client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=f,
-                        language="de",
-                        response_format="text"
-                    )
-                transcripts.append(chunk_transcript)
-
-                if status_callback:
-                    words_in_chunk = len(chunk_transcript.split())
-                    status_callback(f"✓ Teil {i+1}: {words_in_chunk} Wörter transkribiert")
+            # Teile parallel transkribieren (Whisper ist durch HTTP-Latenz begrenzt).
+            # Jeder Chunk wird hochgeladen, sobald ffmpeg ihn fertig geschrieben hat.
+            with ThreadPoolExecutor(max_workers=WHISPER_MAX_CONCURRENCY) as executor:
+                futures = {}
+
+                def submit_chunk(chunk_path: str):
+                    futures[executor.submit(transcribe_chunk, chunk_path, client)] = len(futures)
+                    if status_callback:
+                        status_callback(f"🎙️ Teil {len(futures)} erstellt - Transkription gestartet...")
+
+                try:
+                    chunk_paths = split_audio_file(tmp_path, chunk_callback=submit_chunk)
+
+                    if status_callback:
+                        status_callback(f"📦 {len(chunk_paths)} Audio-Teile erstellt")
+
+                    transcripts = [""] * len(chunk_paths)
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        i = futures[future]
+                        transcripts[i] = future.result()
+                        if progress_callback:
+                            progress_callback(done, len(chunk_paths))
+                        if status_callback:
+                            words_in_chunk = len(transcripts[i].split())
+                            status_callback(f"✓ Teil {i+1}: {words_in_chunk} Wörter transkribiert")
+                except Exception:
+                    # Wartende Teile verwerfen und laufende Uploads abwarten,
+                    # bevor die Chunks im finally-Block gelöscht werden
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
 
             # Alle Transkripte zusammenführen
-            full_transcript = " ".join(transcripts)
+            transcript = " ".join(transcripts)
             if status_callback:
-                total_words = len(full_transcript.split())
+                total_words = len(transcript.split())
                 status_callback(f"✅ Gesamt: {total_words} Wörter aus {len(chunk_paths)} Teilen")
 
-            return full_transcript
+        if cache_key:
+            write_cache("transcripts", cache_key, transcript)
+        return transcript
 
     except Exception as e:
         error_msg = str(e)
@@ -737,20 +935,41 @@ def transcribe_audio(audio_file, client: OpenAI, progress_callback=None, status_
         # Aufräumen
         if os.path.exists(tmp_path):
             os.unlink(tmp_path)
-        for chunk_path in chunk_paths:
-            if chunk_path != tmp_path and os.path.exists(chunk_path):
-                os.unlink(chunk_path)
-
-
-def generate_protocol_text(transcript: str, client: OpenAI) -> str:
-    """Generiert ein strukturiertes Protokoll aus dem Transkript."""
-
-    # Debug: Transkript-Länge
-    transcript_words = len(transcript.split())
-    transcript_chars = len(transcript)
-    print(f"[PROTOKOLL] Transkript-Eingabe: {transcript_words} Wörter, {transcript_chars} Zeichen")
-
-    system_prompt = """Du bist ein professioneller Meeting-Protokollant. Erstelle ein AUSFÜHRLICHES Protokoll im Schweizer Stil.
+        for chunk_path in get_chunk_files(tmp_path):
+            os.unlink(chunk_path)
+
+
+# Füllwörter, verwaiste Satzzeichen und Satzgrenzen für die Transkript-Bereinigung
+FILLER_WORD_RE = re.compile(r"(?:,\s*)?\b(?:ähm|äh|öhm|öh)\b(?:,(?=\s))?", re.IGNORECASE)
+PUNCTUATION_FIXES = (
+    (re.compile(r"\s+(?=[,.!?:;])"), ""),          # "sagte ." -> "sagte."
+    (re.compile(r"[,:;]+(?=[.!?])"), ""),           # "sagte:." -> "sagte."
+    (re.compile(r"(?<![.])([.!?])\.(?!\.)"), r"\1"),  # "Gut.." -> "Gut." (Auslassungspunkte bleiben)
+    (re.compile(r"^[\s,.!?:;]+"), ""),              # Satzzeichen am Anfang
+)
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+LOOP_MIN_WORDS = 6  # Kürzere Wiederholungen ("Ja. Ja.") können verschiedene Sprecher sein
+
+
+def clean_transcript(transcript: str) -> str:
+    """Entfernt Füllwörter, Whisper-Schleifen (direkt wiederholte lange Sätze) und überzählige Leerzeichen."""
+    text = FILLER_WORD_RE.sub("", transcript)
+    for pattern, replacement in PUNCTUATION_FIXES:
+        text = pattern.sub(replacement, text)
+    sentences = []
+    previous = None
+    for sentence in SENTENCE_SPLIT_RE.split(" ".join(text.split())):
+        normalized = sentence.casefold()
+        is_loop = normalized == previous and len(sentence.split()) >= LOOP_MIN_WORDS
+        if sentence and not is_loop:
+            sentences.append(sentence)
+        previous = normalized
+    return " ".join(sentences)
+
+
+# System-Prompt als feste Konstante: OpenAI cacht identische Prompt-Anfänge (ab 1024 Tokens) automatisch.
+# Keine dynamischen Werte (Datum, Zähler) einfügen, sonst greift der Cache nicht mehr.
+PROTOCOL_SYSTEM_PROMPT = """Du bist ein professioneller Meeting-Protokollant. Erstelle ein AUSFÜHRLICHES Protokoll im Schweizer Stil.
 
 ⚠️ KRITISCHE LÄNGENVORGABE ⚠️
 Das Protokoll MUSS MINDESTENS 1800 Wörter haben (ca. 4 A4-Seiten).
@@ -810,19 +1029,40 @@ Das Protokoll MUSS MINDESTENS 1800 Wörter haben (ca. 4 A4-Seiten).
 - Wer hat was gesagt
 - Nichts weglassen!"""
 
-    user_prompt = f"""Hier ist das Meeting-Transkript ({transcript_words} Wörter).
 
-WICHTIG: Erstelle ein AUSFÜHRLICHES Protokoll mit MINDESTENS 1800 Wörtern.
+def generate_protocol_text(transcript: str, client: OpenAI) -> str:
+    """Generiert ein strukturiertes Protokoll aus dem Transkript."""
+    if TRANSCRIPT_CLEANUP_ENABLED:
+        transcript = clean_transcript(transcript)
+
+    # Debug: Transkript-Länge
+    transcript_words = len(transcript.split())
+    transcript_chars = len(transcript)
+    logger.debug("[PROTOKOLL] Transkript-Eingabe: %d Wörter, %d Zeichen", transcript_words, transcript_chars)
+
+    # Feste Anweisungen zuerst, variable Teile (Wortzahl, Transkript) am Ende
+    user_prompt = f"""WICHTIG: Erstelle ein AUSFÜHRLICHES Protokoll mit MINDESTENS 1800 Wörtern.
 Erfasse ALLE besprochenen Themen und Diskussionspunkte.
 Kürze NICHT - jeder Punkt aus dem Transkript ist relevant!
 
+Hier ist das Meeting-Transkript ({transcript_words} Wörter).
+
 TRANSKRIPT:
 {transcript}"""
 
+    # Identischer Prompt schon einmal verarbeitet?
+    cache_key = None
+    if PROTOCOL_CACHE_ENABLED:
+        cache_key = make_cache_key(PROTOCOL_MODEL, PROTOCOL_SYSTEM_PROMPT, user_prompt)
+        cached = read_cache("protocols", cache_key)
+        if cached is not None:
+            logger.debug("[PROTOKOLL] Aus Cache geladen")
+            return cached
+
     response = client.chat.completions.create(
-        model="gpt-4o",
+        model=PROTOCOL_MODEL,
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": PROTOCOL_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ],
         temperature=0.4,
@@ -831,34 +1071,44 @@ TRANSKRIPT:
 
     result = response.choices[0].message.content
     result_words = len(result.split())
-    print(f"[PROTOKOLL] Generiertes Protokoll: {result_words} Wörter")
-
+    logger.debug("[PROTOKOLL] Generiertes Protokoll: %d Wörter", result_words)
+    usage = response.usage
+    if usage is not None:
+        cached_tokens = getattr(usage.prompt_tokens_details, "cached_tokens", 0) or 0
+        logger.debug("[PROTOKOLL] Prompt-Tokens: %d (davon gecached: %d)", usage.prompt_tokens, cached_tokens)
+
+    if cache_key:
+        write_cache("protocols", cache_key, result)
     return result
 
 
+# Vorkompilierte Muster für die Markdown-Parser (PDF und Word)
+NUMBERED_HEADING_RE = re.compile(r"^(\d+)\s+(.+)$")
+META_LABEL_RE = re.compile(r"\*\*(.+?):\*\*\s*(.*)")
+ORDERED_ITEM_RE = re.compile(r"^(\d+)\.(\s*)(.*)")  # Nummer, Abstand, Text
+SIGNATURE_RE = re.compile(r"^[A-Z][a-z]+\s+[A-Z][a-z]+,\s+\d")
+
+
 def parse_markdown_to_pdf(markdown_text: str) -> bytes:
     """Konvertiert Markdown-Protokoll zu PDF und gibt Bytes zurück."""
     pdf = ProtocolPDF()
     pdf.alias_nb_pages()
     pdf.add_page()
 
-    lines = markdown_text.split("\n")
-    i = 0
     in_participants = False
     in_traktanden = False
     in_tasks = False
 
-    while i < len(lines):
-        line = lines[i].strip()
+    for raw_line in io.StringIO(markdown_text):
+        line = raw_line.strip()
 
         if not line:
             in_participants = False
             in_traktanden = False
             in_tasks = False
-            i += 1
             continue
 
-        if line in ["---", "===DECKBLATT===", "===INHALT===", "===ABSCHLUSS==="]:
+        if line in SECTION_MARKERS:
             if line == "===INHALT===":
                 pdf.is_first_page = False
                 pdf.ln(8)
@@ -866,21 +1116,17 @@ def parse_markdown_to_pdf(markdown_text: str) -> bytes:
                 pdf.set_line_width(0.5)
                 pdf.line(pdf.l_margin, pdf.get_y(), pdf.w - pdf.r_margin, pdf.get_y())
                 pdf.ln(4)
-            i += 1
             continue
 
         if line.startswith("|"):
             if "---" in line:
-                i += 1
                 continue
 
             if "Aufgabe" in line or "Zuständig" in line or "Termin" in line:
                 in_tasks = True
-                i += 1
                 continue
 
             if "Name" in line or "Funktion" in line:
-                i += 1
                 continue
 
             parts = [p.strip() for p in line.split("|") if p.strip()]
@@ -891,29 +1137,26 @@ def parse_markdown_to_pdf(markdown_text: str) -> bytes:
                 else:
                     role = parts[1] if len(parts) > 1 else ""
                     pdf.add_participant_row(parts[0], role)
-            i += 1
             continue
 
         if line.startswith("# "):
             title = line[2:].strip()
             pdf.add_main_title(title)
-            i += 1
             continue
 
         if line.startswith("## "):
             subtitle = line[3:].strip()
-            match = re.match(r"^(\d+)\s+(.+)$", subtitle)
+            match = NUMBERED_HEADING_RE.match(subtitle)
             if match:
                 pdf.add_content_title(match.group(1), match.group(2))
             elif "Protokoll" in subtitle:
                 pdf.add_protocol_title(subtitle)
             else:
                 pdf.add_content_title("", subtitle)
-            i += 1
             continue
 
         if line.startswith("**") and ":**" in line:
-            match = re.match(r"\*\*(.+?):\*\*\s*(.*)", line)
+            match = META_LABEL_RE.match(line)
             if match:
                 label = match.group(1) + ":"
                 value = match.group(2)
@@ -929,38 +1172,28 @@ def parse_markdown_to_pdf(markdown_text: str) -> bytes:
                     in_traktanden = True
                 else:
                     pdf.add_meta_label(label, value)
-            i += 1
             continue
 
-        if in_traktanden and re.match(r"^\d+\.", line):
-            match = re.match(r"^(\d+)\.\s*(.+)", line)
-            if match:
-                pdf.add_traktandum(match.group(1), match.group(2))
-            i += 1
-            continue
-
-        if re.match(r"^\d+\.\s", line) and not in_traktanden:
-            match = re.match(r"^(\d+)\.\s*(.+)", line)
-            if match:
-                pdf.add_traktandum(match.group(1), match.group(2))
-            i += 1
+        # Nummerierte Zeile: in den Traktanden auch ohne Abstand ("3.Varia")
+        match = ORDERED_ITEM_RE.match(line)
+        if match and (in_traktanden or match.group(2)):
+            if match.group(3):
+                pdf.add_traktandum(match.group(1), match.group(3))
             continue
 
-        if re.match(r"^[A-Z][a-z]+\s+[A-Z][a-z]+,\s+\d", line):
+        if SIGNATURE_RE.match(line):
             parts = line.split(",", 1)
             if len(parts) == 2:
                 pdf.add_signature(parts[0].strip(), parts[1].strip())
-            i += 1
             continue
 
         if "[Protokollführer" in line or "[Datum" in line:
-            i += 1
             continue
 
-        clean_line = line.replace("**", "").replace("\u2022", "-").strip()
+        # Aufzählungszeichen ersetzt add_body_text
+        clean_line = line.replace("**", "").strip()
         if len(clean_line) > 0:
             pdf.add_body_text(clean_line)
-        i += 1
 
     return bytes(pdf.output())
 
@@ -973,13 +1206,11 @@ def parse_markdown_to_docx(markdown_text: str) -> bytes:
     style.font.name = 'Calibri'
     style.font.size = Pt(11)
 
-    lines = markdown_text.split("\n")
-    i = 0
     in_table = False
     table_data = []
 
-    while i < len(lines):
-        line = lines[i].strip()
+    for raw_line in io.StringIO(markdown_text):
+        line = raw_line.strip()
 
         if not line:
             if in_table and table_data:
@@ -992,25 +1223,21 @@ def parse_markdown_to_docx(markdown_text: str) -> bytes:
                     doc.add_paragraph()
                 table_data = []
                 in_table = False
-            i += 1
             continue
 
-        if line in ["---", "===DECKBLATT===", "===INHALT===", "===ABSCHLUSS==="]:
+        if line in SECTION_MARKERS:
             if line == "===INHALT===":
                 doc.add_paragraph("_" * 60)
-            i += 1
             continue
 
         if line.startswith("|"):
             if "---" in line:
-                i += 1
                 continue
 
             in_table = True
             parts = [p.strip() for p in line.split("|") if p.strip()]
             if parts:
                 table_data.append(parts)
-            i += 1
             continue
 
         if in_table and table_data:
@@ -1031,7 +1258,6 @@ def parse_markdown_to_docx(markdown_text: str) -> bytes:
             run = p.add_run(title)
             run.font.size = Pt(14)
             run.font.color.rgb = RGBColor(100, 100, 100)
-            i += 1
             continue
 
         if line.startswith("## "):
@@ -1040,11 +1266,10 @@ def parse_markdown_to_docx(markdown_text: str) -> bytes:
             run = p.add_run(subtitle)
             run.bold = True
             run.font.size = Pt(13)
-            i += 1
             continue
 
         if line.startswith("**") and ":**" in line:
-            match = re.match(r"\*\*(.+?):\*\*\s*(.*)", line)
+            match = META_LABEL_RE.match(line)
             if match:
                 label = match.group(1) + ":"
                 value = match.group(2)
@@ -1052,31 +1277,25 @@ def parse_markdown_to_docx(markdown_text: str) -> bytes:
                 run_label = p.add_run(label + " ")
                 run_label.bold = True
                 p.add_run(value)
-            i += 1
             continue
 
-        if re.match(r"^\d+\.\s", line):
-            match = re.match(r"^(\d+)\.\s*(.+)", line)
-            if match:
-                p = doc.add_paragraph(f"{match.group(1)}. {match.group(2)}")
-            i += 1
+        match = ORDERED_ITEM_RE.match(line)
+        if match and match.group(2):
+            p = doc.add_paragraph(f"{match.group(1)}. {match.group(3)}")
             continue
 
         if "[Protokollführer" in line or "[Datum" in line:
-            i += 1
             continue
 
-        if re.match(r"^[A-Z][a-z]+\s+[A-Z][a-z]+,\s+\d", line):
+        if SIGNATURE_RE.match(line):
             doc.add_paragraph()
             p = doc.add_paragraph(line)
             p.paragraph_format.space_before = Pt(24)
-            i += 1
             continue
 
         clean_line = line.replace("**", "").replace("\u2022", "-").strip()
         if clean_line:
             doc.add_paragraph(clean_line)
-        i += 1
 
     if in_table and table_data and len(table_data) > 0:
         table = doc.add_table(rows=len(table_data), cols=len(table_data[0]))
@@ -1102,9 +1321,13 @@ def send_email_with_protocol(pdf_bytes: bytes, docx_bytes: bytes, recipient: str
     if not smtp_email or not smtp_password:
         return False, "SMTP-Konfiguration fehlt in .env"
 
-    msg = MIMEMultipart()
-    msg["From"] = smtp_email
-    msg["To"] = recipient
+    msg = EmailMessage()
+    # EmailMessage parst Adressen schon bei der Zuweisung (z.B. "foo@" wirft IndexError)
+    try:
+        msg["From"] = smtp_email
+        msg["To"] = recipient
+    except (ValueError, IndexError, AttributeError):
+        return False, "Ungültige E-Mail-Adresse"
     msg["Subject"] = f"Meeting-Protokoll vom {datetime.now().strftime('%d.%m.%Y')}"
 
     body_text = (
@@ -1113,17 +1336,16 @@ def send_email_with_protocol(pdf_bytes: bytes, docx_bytes: bytes, recipient: str
         f"Freundliche Grüsse\n"
         f"Protokoll AI"
     )
-    msg.attach(MIMEText(body_text, "plain", "utf-8"))
-
-    # PDF anhängen
-    pdf_attachment = MIMEApplication(pdf_bytes, _subtype="pdf")
-    pdf_attachment.add_header("Content-Disposition", "attachment", filename=f"{filename_base}.pdf")
-    msg.attach(pdf_attachment)
-
-    # Word anhängen
-    docx_attachment = MIMEApplication(docx_bytes, _subtype="vnd.openxmlformats-officedocument.wordprocessingml.document")
-    docx_attachment.add_header("Content-Disposition", "attachment", filename=f"{filename_base}.docx")
-    msg.attach(docx_attachment)
+    msg.set_content(body_text, charset="utf-8")
+
+    # PDF und Word anhängen
+    msg.add_attachment(pdf_bytes, maintype="application", subtype="pdf", filename=f"{filename_base}.pdf")
+    msg.add_attachment(
+        docx_bytes,
+        maintype="application",
+        subtype="vnd.openxmlformats-officedocument.wordprocessingml.document",
+        filename=f"{filename_base}.docx",
+    )
 
     try:
         with smtplib.SMTP(smtp_server, smtp_port) as server:
@@ -1143,16 +1365,14 @@ def send_email_with_protocol(pdf_bytes: bytes, docx_bytes: bytes, recipient: str
 
 def render_progress_tracker(current_step: int):
     """Rendert einen minimalistischen Fortschritts-Tracker im Apple-Stil."""
-    steps = ["Upload", "Transkription", "Protokoll", "Dokumente", "Fertig"]
-
     # Einfache Progress Bar
-    progress_value = (current_step - 1) / (len(steps) - 1) if current_step > 1 else 0
+    progress_value = (current_step - 1) / (len(PROGRESS_STEPS) - 1) if current_step > 1 else 0
     st.progress(progress_value)
 
     # Aktueller Schritt als Text
     st.markdown(
         f"<p style='text-align:center; color:#86868b; font-size:14px; margin-top:8px;'>"
-        f"Schritt {current_step} von {len(steps)}: <strong style='color:#1d1d1f;'>{steps[current_step-1]}</strong></p>",
+        f"Schritt {current_step} von {len(PROGRESS_STEPS)}: <strong style='color:#1d1d1f;'>{PROGRESS_STEPS[current_step-1]}</strong></p>",
         unsafe_allow_html=True
     )
 
@@ -1237,12 +1457,13 @@ def get_current_step() -> int:
 # Aktivitäts-Logging
 # ============================================================================
 
-import json
-
 ACTIVITY_LOG_FILE = PROJECT_ROOT / "activity_log.json"
+ACTIVITY_LOG_FLUSH_INTERVAL = 0.5  # Sekunden
+ACTIVITY_LOG_WRITER_NAME = "activity-log-writer"
 
-def log_activity(action: str, details: str = ""):
-    """Speichert eine Aktivität im Log."""
+
+def write_activity_entries(entries: list):
+    """Hängt gepufferte Aktivitäten an die Log-Datei an."""
     try:
         # Bestehende Logs laden
         if ACTIVITY_LOG_FILE.exists():
@@ -1251,23 +1472,73 @@ def log_activity(action: str, details: str = ""):
         else:
             logs = []
 
-        # Neue Aktivität hinzufügen
-        logs.append({
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "action": action,
-            "details": details
-        })
-
-        # Nur letzte 100 Einträge behalten
+        # Neue Aktivitäten hinzufügen, nur letzte 100 Einträge behalten
+        logs.extend(entries)
         logs = logs[-100:]
 
         # Speichern
         with open(ACTIVITY_LOG_FILE, "w", encoding="utf-8") as f:
             json.dump(logs, f, ensure_ascii=False, indent=2)
+        get_activity_logs.clear()
     except:
         pass  # Logging-Fehler ignorieren
 
 
+class ActivityLogWriter(threading.Thread):
+    """Hintergrund-Thread, der Aktivitäten gesammelt in die Log-Datei schreibt."""
+
+    def __init__(self):
+        super().__init__(name=ACTIVITY_LOG_WRITER_NAME, daemon=True)
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()  # Serialisiert Schreiben im Thread und beim Beenden
+        self.pending = []
+
+    def run(self):
+        while True:
+            entry = self.queue.get()
+            with self.lock:
+                self.pending.append(entry)
+            time.sleep(ACTIVITY_LOG_FLUSH_INTERVAL)
+            self.flush()
+
+    def flush(self):
+        """Schreibt alle wartenden Einträge (auch beim Beenden des Prozesses via atexit)."""
+        with self.lock:
+            while True:
+                try:
+                    self.pending.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if self.pending:
+                write_activity_entries(self.pending)
+                self.pending = []
+
+
+@st.cache_resource
+def get_activity_log_writer() -> ActivityLogWriter:
+    """Liefert den einzigen Log-Writer des Prozesses und startet ihn bei Bedarf."""
+    # Streamlit führt das Skript bei jedem Rerun neu aus und ein geleerter Resource-Cache
+    # ruft diese Funktion erneut auf: einen laufenden Writer weiterverwenden, damit nie
+    # zwei Threads gleichzeitig activity_log.json lesen und überschreiben.
+    for thread in threading.enumerate():
+        if thread.name == ACTIVITY_LOG_WRITER_NAME:
+            return thread
+    writer = ActivityLogWriter()
+    writer.start()
+    atexit.register(writer.flush)
+    return writer
+
+
+def log_activity(action: str, details: str = ""):
+    """Speichert eine Aktivität im Log (asynchron, blockiert die UI nicht)."""
+    get_activity_log_writer().queue.put_nowait({
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "action": action,
+        "details": details
+    })
+
+
+@st.cache_data(ttl=30, show_spinner=False)
 def get_activity_logs() -> list:
     """Lädt alle Aktivitäts-Logs."""
     try:
@@ -1340,19 +1611,15 @@ def main():
         }
     )
 
-    # Custom CSS laden
-    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
-
-    # Custom Footer
-    st.markdown('<div class="custom-footer"><a href="https://www.spekt.ch" target="_blank" style="color: #86868b; text-decoration: none;">SPEKTRUM Partner GmbH</a></div>', unsafe_allow_html=True)
+    # Custom CSS und Footer laden
+    st.markdown(STATIC_CHROME_HTML, unsafe_allow_html=True)
 
     # Passwortschutz
     if not check_password():
         st.stop()
 
     # PWA Meta Tags und Service Worker laden
-    st.markdown(PWA_META_TAGS, unsafe_allow_html=True)
-    st.markdown(PWA_SERVICE_WORKER, unsafe_allow_html=True)
+    st.markdown(PWA_HTML, unsafe_allow_html=True)
 
     # Sidebar rendern
     render_sidebar()
@@ -1363,30 +1630,18 @@ def main():
         st.error("OPENAI_API_KEY nicht gefunden! Bitte in .env oder Streamlit Secrets konfigurieren.")
         st.stop()
 
-    client = OpenAI(api_key=api_key)
+    client = get_openai_client(api_key)
 
     # Session State initialisieren
-    if "transcript" not in st.session_state:
-        st.session_state.transcript = None
-    if "protocol" not in st.session_state:
-        st.session_state.protocol = None
-    if "pdf_bytes" not in st.session_state:
-        st.session_state.pdf_bytes = None
-    if "docx_bytes" not in st.session_state:
-        st.session_state.docx_bytes = None
-    if "processing" not in st.session_state:
-        st.session_state.processing = False
-    if "error" not in st.session_state:
-        st.session_state.error = None
+    for key, value in SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
 
     # Hero Header - Apple Style mit Logo mittig
     st.markdown("")
 
     # Logo oben mittig mit CSS
     if LOGO_AVAILABLE:
-        import base64
-        with open(LOGO_PATH, "rb") as f:
-            logo_data = base64.b64encode(f.read()).decode()
+        logo_data = get_logo_base64()
         st.markdown(f"""
             <div style="display: flex; justify-content: center; margin-bottom: 1rem;">
                 <img src="data:image/png;base64,{logo_data}" width="100">
@@ -1402,8 +1657,7 @@ def main():
     # FERTIG - Dokumente bereit
     # =========================================================================
     if st.session_state.pdf_bytes:
-        st.markdown("<p style='text-align:center; font-size:17px; color:#34c759;'>✓ Dein Protokoll ist fertig!</p>", unsafe_allow_html=True)
-        st.markdown("")
+        st.markdown("<p style='text-align:center; font-size:17px; color:#34c759; margin-bottom:1.5rem;'>✓ Dein Protokoll ist fertig!</p>", unsafe_allow_html=True)
 
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
         filename_pdf = f"Protokoll_{timestamp}.pdf"
@@ -1428,13 +1682,10 @@ def main():
                 use_container_width=True
             )
 
-        st.markdown("")
         st.markdown("---")
-        st.markdown("")
 
         # E-Mail Versand
-        st.markdown("<p style='text-align:center; color:#1d1d1f; font-weight:600;'>Per E-Mail versenden</p>", unsafe_allow_html=True)
-        st.markdown("")
+        st.markdown("<p style='text-align:center; color:#1d1d1f; font-weight:600; margin-bottom:1.5rem;'>Per E-Mail versenden</p>", unsafe_allow_html=True)
 
         recipient = st.text_input("", placeholder="E-Mail-Adresse eingeben", label_visibility="collapsed")
 
@@ -1456,23 +1707,14 @@ def main():
             else:
                 st.warning("Bitte E-Mail-Adresse eingeben")
 
-        st.markdown("")
-        st.markdown("")
-
         # Protokoll anzeigen (optional)
+        st.markdown("<div style='height:2rem;'></div>", unsafe_allow_html=True)
         with st.expander("Protokoll anzeigen"):
             st.text_area("", st.session_state.protocol, height=300, label_visibility="collapsed")
 
-        st.markdown("")
-
         # Neu starten
         if st.button("Neues Protokoll erstellen", use_container_width=True):
-            st.session_state.transcript = None
-            st.session_state.protocol = None
-            st.session_state.pdf_bytes = None
-            st.session_state.docx_bytes = None
-            st.session_state.processing = False
-            st.session_state.error = None
+            st.session_state.update(SESSION_DEFAULTS)
             st.rerun()
 
     # =========================================================================
@@ -1502,7 +1744,7 @@ def main():
         if uploaded_file and not st.session_state.processing and not st.session_state.error:
             st.session_state.processing = True
 
-            file_size = len(uploaded_file.getvalue())
+            file_size = uploaded_file.size
 
             if file_size > MAX_FILE_SIZE:
                 st.session_state.error = f"Datei ist zu gross ({file_size // (1024*1024)} MB). Maximum: {MAX_FILE_SIZE_MB} MB"